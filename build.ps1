@@ -45,6 +45,10 @@ Write-Output "Wrote data from rk4.py to python_results.dat"
 Write-Output "Validating C++ Results with Python results: Limit Cycles Parameters"
 python.exe ./python/validation.py
 
+# classify the example orbits (period, rotation number, convergence time)
+Write-Output "Classifying Orbits: Limit Cycles and Chaotic Examples"
+python.exe ./python/periodic.py
+
 # run python script!
 $userInput = Read-Host -Prompt "Start Python simulation? Y/N"
 while ($userInput -eq "Y") {
@@ -0,0 +1,273 @@
+# Programmer: Connor Fricke
+# File: periodic.py
+# Latest Revision: 19-OCTOBER-2026 --> Created
+# Analysis stage for telling limit cycles apart from chaos without watching the
+# PyGame animation. The pendulum is sampled stroboscopically (once per drive period
+# T_ext, the same points the C++ program sends to plot2()) and the strobe samples are
+# checked for a repeating pattern of period k, k = 1 ... KMAX.
+#
+# Detection works in two steps:
+#   1) each strobe sample is hashed into a grid cell of size TOL in the (theta, theta_dot)
+#      plane, and the last strobe index seen in each cell is remembered. A sample landing
+#      in (or next to) a cell visited k strobes ago gives a candidate period k.
+#   2) the candidate is confirmed with a tolerance match over a rolling window: the last
+#      CONFIRM*k samples must each match the sample k strobes before them.
+# Once an orbit is confirmed, integration stops early, which makes large parameter sweeps
+# much cheaper since converged runs exit long before TMAX.
+#
+# Reported for each run:
+#   period      --- k, the number of drive periods before the orbit repeats (0 if not found)
+#   winding     --- number of full turns the pendulum makes every k drive periods
+#   rotation    --- rotation number, winding / k (turns per drive period, 0 for oscillation)
+#   t_converged --- time of the first strobe sample that matched the sample k strobes before it
+#   kmax_tested --- longest period the run had enough strobe samples to test (at most KMAX)
+#
+# To Run (from the project directory):
+# > python ./python/periodic.py
+
+from math import cos, sin, pi, floor, fabs
+import os
+
+# PATH STUFF
+PROJ_DIR = os.getcwd()
+DATA_PATH = PROJ_DIR + "/datafiles/"
+
+# CONSTANTS
+KMAX = 64               # longest period we look for, in drive periods
+TOL = 1.0e-4            # tolerance for matching strobe samples (theta and theta_dot)
+CONFIRM = 3             # number of repeats of a period-k pattern needed to confirm it
+T_SKIP = 1000           # RK4 steps per drive period, same as the C++ program
+MAX_PERIODS = 1000      # give up after this many drive periods
+
+# DEFAULT PARAMETERS (limit cycles example, same as rk4.py)
+DEFAULT_PARAMS = {
+    "omega0": 1.0,      # natural frequency of pendulum
+    "alpha": 0.2,       # damping force, viscous
+    "f_ext": 0.52,      # sinusoidal driving force amplitude
+    "w_ext": 0.694,     # sinusoidal driving force frequency
+    "phi_ext": 0.0,     # sinusoidal driving force phase constant
+    "theta0": 0.8,      # initial angular position
+    "theta_dot0": 0.8,  # initial angular velocity
+}
+
+
+# ***** FUNCTIONS *****
+# right hand side of the differential equation, as in rk4.py, except the
+# pendulum parameters are passed in (like the void pointer in the C++ version)
+# so that many parameter sets can be solved in the same process.
+def rhs(t, y, i, params):
+    # external force (driving motor)
+    F_ext = params["f_ext"] * cos(params["w_ext"] * t + params["phi_ext"])
+
+    if (i == 0):
+        return (y[1])
+    if (i == 1):
+        omega0 = params["omega0"]
+        return (-omega0 * omega0 * sin(y[0]) - params["alpha"] * y[1] + F_ext)
+
+    # we shouldn't get here
+    return (1)
+
+# 4th Order Runge-Kutta step from t to t+h, Eq.(9.46) in Landau and Paez.
+# The original values of y[0], y[1], etc. are lost.
+def runge4(N, t, y, h, params):
+    k1 = [h * rhs(t, y, i, params) for i in range(N)]
+    y1 = [y[i] + k1[i] / 2.0 for i in range(N)]  # argument for k2
+
+    k2 = [h * rhs(t + h / 2.0, y1, i, params) for i in range(N)]
+    y2 = [y[i] + k2[i] / 2.0 for i in range(N)]  # argument for k3
+
+    k3 = [h * rhs(t + h / 2.0, y2, i, params) for i in range(N)]
+    y3 = [y[i] + k3[i] for i in range(N)]        # argument for k4
+
+    k4 = [h * rhs(t + h, y3, i, params) for i in range(N)]
+
+    for i in range(N):
+        y[i] += (k1[i] + 2. * k2[i] + 2. * k3[i] + k4[i]) / 6.0
+
+# map an angle onto (-pi, pi]
+def wrapAngle(theta) -> float:
+    theta = theta % (2 * pi)
+    if (theta > pi):
+        theta -= 2 * pi
+    return theta
+
+
+# *** CLASSES ***
+class StrobeDetector:
+    def __init__(self, kmax=KMAX, tol=TOL, confirm=CONFIRM):
+        # constants
+        self.KMAX = kmax
+        self.TOL = tol
+        self.CONFIRM = confirm
+        self.WINDOW = kmax * (confirm + 1) + 1   # samples kept in the rolling window
+        self.NCELLS = int(floor(2 * pi / tol))  # hash cells around the circle in theta
+        # variables
+        self.count = 0          # number of strobe samples seen so far
+        self.samples = []       # rolling window of (t, theta, theta_dot), theta unwrapped
+        self.cells = {}         # hash cell -> last strobe index that landed in it
+        self.period = 0         # detected period (0 until the orbit has locked)
+        self.winding = 0        # full turns per period
+        self.t_converged = None # time of the first matched sample in the confirmed window
+
+    # hash cell for a strobe sample; theta cells wrap around so that -pi and pi are neighbors
+    def cell(self, theta, theta_dot):
+        ix = int(floor((wrapAngle(theta) + pi) / self.TOL)) % self.NCELLS
+        iy = int(floor(theta_dot / self.TOL))
+        return (ix, iy)
+
+    # True if strobe samples a and b are the same point in phase space (to within TOL)
+    def matches(self, a, b) -> bool:
+        return (fabs(wrapAngle(a[1] - b[1])) <= self.TOL and fabs(a[2] - b[2]) <= self.TOL)
+
+    # add the next strobe sample, returns the period once the orbit has locked (0 otherwise)
+    def addSample(self, t, theta, theta_dot) -> int:
+        if (self.period):
+            return self.period
+
+        n = self.count
+        self.count += 1
+        self.samples.append((t, theta, theta_dot))
+        if (len(self.samples) > self.WINDOW):
+            self.samples.pop(0)
+
+        # candidate periods from the current cell and its neighbors
+        ix, iy = self.cell(theta, theta_dot)
+        candidates = set()
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                j = self.cells.get(((ix + dx) % self.NCELLS, iy + dy))
+                if (j is not None and n - j <= self.KMAX):
+                    candidates.add(n - j)
+        self.cells[(ix, iy)] = n
+
+        # confirm the shortest candidate that repeats over the rolling window
+        for k in sorted(candidates):
+            if (self.confirm(k)):
+                last = len(self.samples) - 1
+                first = last - self.CONFIRM * k + 1
+                self.period = k
+                self.winding = int(round((self.samples[last][1] - self.samples[last - k][1]) / (2 * pi)))
+                self.t_converged = self.samples[first][0]
+                break
+
+        return self.period
+
+    # check that the last CONFIRM*k samples each match the sample k strobes before them
+    def confirm(self, k) -> bool:
+        last = len(self.samples) - 1
+        if (last - (self.CONFIRM + 1) * k + 1 < 0):
+            return False
+        for m in range(self.CONFIRM * k):
+            if (not self.matches(self.samples[last - m], self.samples[last - m - k])):
+                return False
+        return True
+
+    # summary of the detection, as a dictionary
+    def result(self):
+        return {
+            "period": self.period,
+            "winding": self.winding,
+            "rotation": (self.winding / self.period) if self.period else 0.0,
+            "t_converged": self.t_converged,
+            "strobes": self.count,
+            "kmax": self.KMAX,
+            # confirm(k) needs (CONFIRM + 1) * k samples
+            "kmax_tested": min(self.KMAX, self.count // (self.CONFIRM + 1)),
+        }
+# *************************
+
+
+# ***** ANALYSIS ROUTINES *****
+# integrate the pendulum with RK4, strobing once per drive period, and stop as soon
+# as the orbit has locked onto a period-k cycle (or after max_periods drive periods).
+def classifyOrbit(params=DEFAULT_PARAMS, max_periods=MAX_PERIODS, t_skip=T_SKIP,
+                  kmax=KMAX, tol=TOL, confirm=CONFIRM):
+    N = 2
+    T_ext = 2 * pi / params["w_ext"]    # external force period
+    h = T_ext / float(t_skip)           # time step for RK4 algorithm
+    y_rk4 = [params["theta0"], params["theta_dot0"]]
+    detector = StrobeDetector(kmax, tol, confirm)
+
+    detector.addSample(0.0, y_rk4[0], y_rk4[1])
+    for period in range(max_periods):
+        for step in range(t_skip):
+            # step count instead of t += h, so the strobe lands on t = period * T_ext
+            t = (period * t_skip + step) * h
+            runge4(N, t, y_rk4, h, params)
+        if (detector.addSample((period + 1) * T_ext, y_rk4[0], y_rk4[1])):
+            break  # converged, exit early
+
+    result = detector.result()
+    result["t_end"] = detector.count * T_ext - T_ext
+    return result
+
+# classify an existing data file written by diffeq_pendulum.cpp (or rk4.py).
+# The strobe samples are the rows with t on a multiple of T_ext. T_ext is taken from
+# w_ext if given, otherwise from the h in the file header (h = T_ext / T_SKIP, as set
+# by queryParameters()). Files that skip a drive period (plot_skip does not divide
+# T_SKIP) are refused, since the strobe samples would not be consecutive.
+def classifyFile(filename, w_ext=None, t_skip=T_SKIP, kmax=KMAX, tol=TOL, confirm=CONFIRM):
+    detector = StrobeDetector(kmax, tol, confirm)
+    T_ext = (2 * pi / w_ext) if w_ext else None
+    h = None
+    t_end = 0.0
+    strobe = None   # index of the last strobe sample, t = strobe * T_ext
+    with open(filename, "r") as data:
+        for line in data:
+            if (line.startswith("#")):
+                # header line: "# t_start=0, t_end=200, h=0.00905358"
+                for entry in line.strip("# \n").split(","):
+                    if (entry.strip().startswith("h=")):
+                        h = float(entry.strip()[2:])
+                continue
+            values = line.split()
+            if (len(values) != 3):
+                continue
+            if (h is None):
+                raise ValueError("{}: no h in file header, cannot find T_ext".format(filename))
+            if (T_ext is None):
+                T_ext = t_skip * h
+
+            t = float(values[0])
+            n = int(round(t / T_ext))
+            if (fabs(t - n * T_ext) > h / 2.0):
+                continue  # not a strobe row
+            if (strobe is not None and n != strobe + 1):
+                raise ValueError("{}: no row at t = {:.4f}, strobe samples are not one drive period "
+                                 "apart (plot_skip must divide T_skip)".format(filename, (strobe + 1) * T_ext))
+            strobe = n
+            t_end = t
+            if (detector.addSample(t, float(values[1]), float(values[2]))):
+                break
+
+    result = detector.result()
+    result["t_end"] = t_end
+    return result
+
+# IO function for printing a classification
+def displayResult(name, result):
+    print(name)
+    if (result["period"]):
+        print("  period-{} orbit, rotation number {} ({} turns per {} drive periods)".format(
+            result["period"], result["rotation"], result["winding"], result["period"]))
+        print("  converged at t = {:.2f}, detected at t = {:.2f}".format(
+            result["t_converged"], result["t_end"]))
+    elif (result["kmax_tested"] < result["kmax"]):
+        print("  no period found, but only {} strobe samples by t = {:.2f}: not enough to test k > {}".format(
+            result["strobes"], result["t_end"], result["kmax_tested"]))
+    else:
+        print("  no period up to {} found by t = {:.2f} (chaotic or still transient)".format(
+            result["kmax"], result["t_end"]))
+
+
+# ***** MAIN PROGRAM ******
+if __name__ == "__main__":
+    chaotic = dict(DEFAULT_PARAMS, f_ext=0.9, w_ext=0.54, theta0=-0.8, theta_dot0=0.1234)
+    displayResult("Limit Cycles Example (RK4):", classifyOrbit(DEFAULT_PARAMS))
+    displayResult("Chaotic Example (RK4):", classifyOrbit(chaotic, max_periods=200))
+    print("\n")
+    for DATA_FILE in ["limit_cycles.dat", "chaotic.dat", "diffeq_pendulum.dat"]:
+        if (os.path.exists(DATA_PATH + DATA_FILE)):
+            displayResult(DATA_FILE + ":", classifyFile(DATA_PATH + DATA_FILE))
+# ****** END *******
@@ -0,0 +1,210 @@
+# Programmer: Connor Fricke
+# File: sweep.py
+# Latest Revision: 19-OCTOBER-2026 --> Created
+# Parameter sweep scheduler for the damped, driven pendulum. The grid of f_ext, w_ext,
+# alpha and initial conditions (the values hard-coded at the top of rk4.py and prompted
+# for in queryParameters() in diffeq_pendulum.cpp) is split into work units, which are
+# run on a process pool. Each point is classified with classifyOrbit() from periodic.py,
+# so converged runs exit early.
+#
+# Results go into a preallocated memory-mapped array (datafiles/sweep/results.dat) that
+# every worker writes its rows into directly. When a unit is finished, its number is
+# appended to the checkpoint file (datafiles/sweep/checkpoint.dat). If the job is killed,
+# running the script again skips every unit listed in the checkpoint and picks up where
+# it stopped. The grid and classifier settings are saved in datafiles/sweep/grid.dat, and a
+# sweep only resumes if they still match; otherwise the script stops without touching the
+# old results. Delete (or move) the datafiles/sweep directory to start a new sweep.
+#
+# Each row of the result array holds:
+#   f_ext, w_ext, alpha, theta0, theta_dot0, period, winding, rotation, t_converged, t_end
+# Rows that have not been computed yet are NaN. t_converged is NaN if no period was found.
+#
+# To Run (from the project directory):
+# > python ./python/sweep.py
+
+from periodic import classifyOrbit, DEFAULT_PARAMS, MAX_PERIODS, KMAX, TOL, CONFIRM, T_SKIP
+from multiprocessing import Pool, cpu_count
+from numpy import linspace, memmap, nan, unravel_index
+import signal
+import sys
+import time
+import os
+
+# PATH STUFF
+PROJ_DIR = os.getcwd()
+SWEEP_PATH = PROJ_DIR + "/datafiles/sweep/"
+RESULTS_FILE = SWEEP_PATH + "results.dat"
+CHECKPOINT_FILE = SWEEP_PATH + "checkpoint.dat"
+GRID_FILE = SWEEP_PATH + "grid.dat"
+
+# CONSTANTS
+UNIT_SIZE = 8           # grid points per work unit
+PROCESSES = cpu_count() # size of the process pool
+FIELDS = ["f_ext", "w_ext", "alpha", "theta0", "theta_dot0",
+          "period", "winding", "rotation", "t_converged", "t_end"]
+
+# PARAMETER GRID (every combination is run)
+GRID = {
+    "f_ext": linspace(0.2, 1.2, 11),    # sinusoidal driving force amplitude
+    "w_ext": linspace(0.5, 0.8, 7),     # sinusoidal driving force frequency
+    "alpha": [0.2],                     # damping force, viscous
+    "theta0": [0.8],                    # initial angular position
+    "theta_dot0": [0.0, 0.8],           # initial angular velocity
+}
+AXES = ["f_ext", "w_ext", "alpha", "theta0", "theta_dot0"]
+
+
+# ***** FUNCTIONS *****
+# shape of the parameter grid and the total number of points in it
+def gridShape(grid):
+    shape = tuple(len(grid[axis]) for axis in AXES)
+    size = 1
+    for n in shape:
+        size *= n
+    return shape, size
+
+# text description of the grid and every setting that changes the results, saved
+# next to the results so that a resumed job can check that it is still running the same sweep
+def gridSpec(grid, unit_size, max_periods):
+    lines = ["# unit_size=" + str(unit_size) + "\n",
+             "# max_periods={}, kmax={}, tol={!r}, confirm={}, t_skip={}\n".format(
+                 max_periods, KMAX, TOL, CONFIRM, T_SKIP)]
+    for name in sorted(DEFAULT_PARAMS):
+        if (name not in AXES):
+            lines.append("# {}={!r}\n".format(name, float(DEFAULT_PARAMS[name])))
+    for axis in AXES:
+        lines.append(axis + " " + " ".join(repr(float(x)) for x in grid[axis]) + "\n")
+    return "".join(lines)
+
+# split the flattened grid into (unit, start, stop) work units
+def workUnits(size, unit_size):
+    return [(unit, start, min(start + unit_size, size))
+            for unit, start in enumerate(range(0, size, unit_size))]
+
+# open the result array. mode "w+" preallocates it, "r+" reopens it for writing
+def openResults(size, mode="r+"):
+    return memmap(RESULTS_FILE, dtype="float64", mode=mode, shape=(size, len(FIELDS)))
+
+# units already listed in the checkpoint file
+def readCheckpoint():
+    done = set()
+    if (os.path.exists(CHECKPOINT_FILE)):
+        with open(CHECKPOINT_FILE, "r") as checkpoint:
+            for line in checkpoint:
+                if (line.strip()):
+                    done.add(int(line))
+    return done
+
+# set up the sweep directory, or check that an existing one matches the grid and settings.
+# Returns the set of units that are already complete. An existing sweep with different
+# settings is never overwritten: the program stops and the user has to move it out of the way.
+def prepareSweep(grid, unit_size, max_periods):
+    shape, size = gridShape(grid)
+    spec = gridSpec(grid, unit_size, max_periods)
+    os.makedirs(SWEEP_PATH, exist_ok=True)
+
+    if (os.path.exists(RESULTS_FILE)):
+        if (os.path.exists(GRID_FILE)):
+            with open(GRID_FILE, "r") as gridfile:
+                if (gridfile.read() == spec):
+                    return readCheckpoint()
+        sys.exit("Error: datafiles/sweep holds a sweep with a different grid or settings.\n"
+                 "Delete or move the datafiles/sweep directory to start a new sweep.")
+
+    # new sweep: preallocate results as NaN, clear checkpoint, save the grid
+    results = openResults(size, mode="w+")
+    results[:] = nan
+    results.flush()
+    del results
+    open(CHECKPOINT_FILE, "w").close()
+    with open(GRID_FILE, "w") as gridfile:
+        gridfile.write(spec)
+    return set()
+
+# pool initializer: leave Ctrl+C to the main process, which terminates the pool
+def ignoreInterrupt():
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+# worker: classify every grid point in one work unit and write the rows straight
+# into the memory-mapped result array. Returns the unit number when done.
+def runUnit(args):
+    unit, start, stop, grid, max_periods = args
+    shape, size = gridShape(grid)
+    results = openResults(size)
+    for index in range(start, stop):
+        point = unravel_index(index, shape)
+        params = dict(DEFAULT_PARAMS)
+        for axis, i in zip(AXES, point):
+            params[axis] = float(grid[axis][i])
+
+        result = classifyOrbit(params, max_periods=max_periods)
+        t_converged = result["t_converged"] if result["period"] else nan
+        results[index] = [params["f_ext"], params["w_ext"], params["alpha"],
+                          params["theta0"], params["theta_dot0"],
+                          result["period"], result["winding"], result["rotation"],
+                          t_converged, result["t_end"]]
+    results.flush()
+    return unit, stop - start
+
+# run the sweep on a process pool, checkpointing units as they complete.
+# Returns True once every unit is done, False if the sweep was interrupted.
+def runSweep(grid=GRID, unit_size=UNIT_SIZE, processes=PROCESSES, max_periods=MAX_PERIODS):
+    shape, size = gridShape(grid)
+    done = prepareSweep(grid, unit_size, max_periods)
+    units = workUnits(size, unit_size)
+    pending = [(unit, start, stop, grid, max_periods)
+               for unit, start, stop in units if unit not in done]
+
+    print("Sweep: {} points in {} units, {} already complete.".format(size, len(units), len(done)))
+    if (not pending):
+        return True
+
+    remaining = sum(stop - start for unit, start, stop, g, m in pending)
+    points = 0
+    startTime = time.time()
+    pool = Pool(processes, initializer=ignoreInterrupt)
+    try:
+        with open(CHECKPOINT_FILE, "a") as checkpoint:
+            for unit, count in pool.imap_unordered(runUnit, pending):
+                # only mark the unit done once its rows are flushed to disk
+                checkpoint.write(str(unit) + "\n")
+                checkpoint.flush()
+                os.fsync(checkpoint.fileno())
+                done.add(unit)
+
+                # progress, throughput, ETA
+                points += count
+                elapsed = time.time() - startTime
+                rate = points / elapsed
+                eta = (remaining - points) / rate
+                print("[{}/{} units] {:.2f} points/s, elapsed {:.0f} s, ETA {:.0f} s".format(
+                    len(done), len(units), rate, elapsed, eta))
+        pool.close()
+    except KeyboardInterrupt:
+        pool.terminate()
+        print("\nInterrupted. Run again to resume from the last checkpoint.")
+    except BaseException:
+        # a worker failed: stop the pool and pass the worker's exception on
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+
+    return len(done) == len(units)
+
+# read-only view of the results, one row per grid point (NaN rows not yet computed)
+def loadResults(grid=GRID):
+    shape, size = gridShape(grid)
+    return memmap(RESULTS_FILE, dtype="float64", mode="r", shape=(size, len(FIELDS)))
+
+
+# ***** MAIN PROGRAM ******
+if __name__ == "__main__":
+    if (not runSweep()):
+        sys.exit(1)
+    results = loadResults()
+    periodic = (results[:, FIELDS.index("period")] > 0).sum()
+    print("Sweep complete: {} points, {} periodic, {} chaotic or unconverged.".format(
+        len(results), periodic, len(results) - periodic))
+    print("Results written to datafiles/sweep/results.dat")
+# ****** END *******